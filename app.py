@@ -6,22 +6,35 @@ License: MIT
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+import hashlib
+import html
+import io
+import queue
 import re
-from dataclasses import dataclass
-from typing import Dict, Tuple
+import string
+import threading
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, Optional, Tuple
 
+import numpy as np
+import orjson
 import streamlit as st
 
-try:
-    from openai import OpenAI, APIConnectionError, APIError, AuthenticationError, RateLimitError, OpenAIError
-except Exception:
-    OpenAI = None  # type: ignore
-    APIConnectionError = APIError = AuthenticationError = RateLimitError = OpenAIError = Exception  # type: ignore
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+# The openai SDK (httpx, pydantic, anyio) is imported on first use so cold starts paint sooner
+_OPENAI_CLS = None
+_OPENAI_ERRORS: Optional[tuple] = None
 
 
 APP_TITLE = "AI Sentiment Analyzer"
 DEFAULT_MODEL = "gpt-4o"
+EMBEDDING_MODEL = "text-embedding-3-small"
+SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_CACHE_SIZE = 256
 
 RECOMMENDED_MODELS = [
     ("gpt-5", "Next-gen flagship model"),
@@ -31,8 +44,69 @@ RECOMMENDED_MODELS = [
     ("gpt-4o", "Strong vision + reasoning"),
     ("gpt-4o-mini", "Fast + cost-efficient"),
 ]
+MODEL_OPTION_LABELS = [f"{mid} — {note}" for mid, note in RECOMMENDED_MODELS]
+DEFAULT_MODEL_INDEX = next((idx for idx, (mid, _) in enumerate(RECOMMENDED_MODELS) if mid == DEFAULT_MODEL), 0)
+
+_KEY_RE = re.compile(r"^(?:sk-|sess-|rk-).+")
 
 SENTIMENT_LABELS = ["Positive", "Negative", "Neutral", "Mixed"]
+_SENTIMENT_SET = frozenset(SENTIMENT_LABELS)
+_SENTIMENT_ICONS = {"Positive": "😊", "Negative": "😞", "Neutral": "😐", "Mixed": "😕"}
+_SENTIMENT_COLORS = {"Positive": "#10b981", "Negative": "#ef4444", "Neutral": "#6b7280", "Mixed": "#f59e0b"}
+
+SENTIMENT_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "sentiment": {"type": "string", "enum": SENTIMENT_LABELS},
+        "confidence": {"type": "number"},
+        "explanation": {"type": "string"},
+        "key_phrases": {"type": "array", "items": {"type": "string"}, "maxItems": 8},
+    },
+    "required": ["sentiment", "confidence", "explanation", "key_phrases"],
+    "additionalProperties": False,
+}
+
+# GPT-4o/4.1 enforce the schema server-side; GPT-5 reasoning models get plain JSON mode
+STRUCTURED_RESPONSE_FORMAT = {"type": "json_schema", "json_schema": {"name": "sentiment", "schema": SENTIMENT_JSON_SCHEMA, "strict": True}}
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+_RESULT_CARD = string.Template("""
+                        <div class="info-card" style="border-left: 4px solid ${color};">
+                            <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 1rem;">
+                                <div>
+                                    <div style="font-size: 0.85rem; color: #6b7280; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 0.3rem;">Detected Sentiment</div>
+                                    <div style="font-size: 2rem; font-weight: 700; color: ${color}; display: flex; align-items: center; gap: 0.5rem;"><span>${emoji}</span><span>${sentiment}</span></div>
+                                </div>
+                                <div style="text-align: right;">
+                                    <div style="font-size: 0.85rem; color: #6b7280; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 0.3rem;">Confidence</div>
+                                    <div style="font-size: 2rem; font-weight: 700; color: ${color};">${confidence_pct}%</div>
+                                </div>
+                            </div>
+                            <div style="background: #f9fafb; padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
+                                <div style="font-size: 0.9rem; color: #374151; line-height: 1.6;"><strong style="color: #1f2937;">💡 Explanation:</strong> ${explanation}</div>
+                            </div>
+                    """)
+
+SYSTEM_PROMPT = "You are a careful sentiment analysis assistant. Classify sentiment for the user's text into exactly one of: Positive, Negative, Neutral, Mixed. Return strict JSON only (no markdown)."
+PROMPT_SCHEMA = {
+    "sentiment": "Positive|Negative|Neutral|Mixed",
+    "confidence": "number between 0 and 1",
+    "explanation": "short explanation (1-3 sentences)",
+    "key_phrases": "array of 3-8 short phrases from the input that justify the sentiment",
+}
+# Built once so every request shares a byte-identical prefix (helps OpenAI's automatic prompt caching)
+_SCHEMA_JSON = orjson.dumps(PROMPT_SCHEMA).decode()
+_USER_PREFIX = f"Analyze the sentiment of the following text and return JSON with keys exactly as in this schema: {_SCHEMA_JSON}\n\nText: "
+
+_PILL_TMPL = string.Template('<span style="display: inline-block; background: ${c}20; color: ${c}; padding: 0.35rem 0.75rem; border-radius: 999px; margin: 0.25rem; font-size: 0.9rem; font-weight: 500; border: 1px solid ${c}40;">${p}</span>')
+
+# Each pattern only matches once the field's JSON value has fully streamed in
+_PARTIAL_PATTERNS = {
+    "sentiment": re.compile(r'"sentiment"\s*:\s*("(?:[^"\\]|\\.)*")'),
+    "confidence": re.compile(r'"confidence"\s*:\s*(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)\s*[,}]'),
+    "explanation": re.compile(r'"explanation"\s*:\s*("(?:[^"\\]|\\.)*")'),
+    "key_phrases": re.compile(r'"key_phrases"\s*:\s*(\[(?:[^\]"]|"(?:[^"\\]|\\.)*")*\])'),
+}
 
 EXAMPLES: Dict[str, str] = {
     "Positive": "I'm genuinely impressed by how quickly the team resolved my issue. The support agent was patient, clear, and followed up to ensure everything worked.",
@@ -51,22 +125,77 @@ class SentimentResult:
 
 
 def _looks_like_openai_key(key: str) -> bool:
-    key = key.strip()
-    return bool(re.match(r"^(sk-|sess-|rk-).+", key)) or len(key) >= 20 if key else False
+    k = key.strip()
+    return bool(k) and (bool(_KEY_RE.match(k)) or len(k) >= 20)
 
 
-def _get_client(api_key: str) -> "OpenAI":
-    if OpenAI is None:
-        raise RuntimeError("openai package is not installed")
-    return OpenAI(api_key=api_key)
+@st.cache_resource(show_spinner=False)
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    # One long-lived loop: the cached async client's connection pool is bound to the loop that first uses it
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="openai-event-loop", daemon=True).start()
+    return loop
 
 
-def validate_api_key(api_key: str) -> Tuple[bool, str]:
+def _run_async(coro: Coroutine[Any, Any, Any], updates: Optional[queue.SimpleQueue] = None, on_update: Optional[Callable[[dict], None]] = None) -> Any:
+    """Run coro on the shared loop, relaying anything it puts on updates to on_update in the script thread."""
+    future = asyncio.run_coroutine_threadsafe(coro, _get_event_loop())
+    try:
+        if updates is not None and on_update is not None:
+            while not (future.done() and updates.empty()):
+                try:
+                    on_update(updates.get(timeout=0.05))
+                except queue.Empty:
+                    pass
+        return future.result()
+    finally:
+        # A widget interaction mid-stream raises Streamlit's rerun/stop exception out of on_update;
+        # cancel so the request stops streaming (and billing) on the loop. No-op once done.
+        future.cancel()
+
+
+@st.cache_resource(show_spinner=False, max_entries=32, ttl=3600, hash_funcs={str: lambda k: hashlib.sha256(k.encode()).hexdigest()})
+def _get_client(api_key: str) -> "AsyncOpenAI":
+    global _OPENAI_CLS
+    if _OPENAI_CLS is None:
+        try:
+            from openai import AsyncOpenAI
+        except Exception:
+            raise RuntimeError("openai package is not installed")
+        _OPENAI_CLS = AsyncOpenAI
+    return _OPENAI_CLS(api_key=api_key)
+
+
+def _openai_errors() -> tuple:
+    """Return (APIConnectionError, APIError, AuthenticationError, RateLimitError, OpenAIError)."""
+    global _OPENAI_ERRORS
+    if _OPENAI_ERRORS is None:
+        try:
+            from openai import APIConnectionError, APIError, AuthenticationError, OpenAIError, RateLimitError
+        except Exception:
+            APIConnectionError = APIError = AuthenticationError = RateLimitError = OpenAIError = Exception  # type: ignore
+        _OPENAI_ERRORS = (APIConnectionError, APIError, AuthenticationError, RateLimitError, OpenAIError)
+    return _OPENAI_ERRORS
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _probe_api_key(api_key: str) -> bool:
+    # Errors propagate instead of being returned, so only successful probes are cached
+    client = _get_client(api_key)
+    # A 1-token completion is far cheaper than listing every model on the account
+    _run_async(client.chat.completions.create(model="gpt-4o-mini", messages=[{"role": "user", "content": "."}], max_tokens=1))
+    return True
+
+
+def validate_api_key(api_key: str, probe: bool = False) -> Tuple[bool, str]:
     if not _looks_like_openai_key(api_key):
         return False, "Key format looks incorrect."
+    if not probe:
+        # The first analysis doubles as the real check; AuthenticationError there resets key_valid
+        return True, "Format OK — will verify on first analysis."
+    APIConnectionError, APIError, AuthenticationError, RateLimitError, OpenAIError = _openai_errors()
     try:
-        client = _get_client(api_key)
-        _ = client.models.list()
+        _probe_api_key(api_key)
         return True, "Key validated successfully."
     except AuthenticationError:
         return False, "Authentication failed: invalid or revoked API key."
@@ -82,68 +211,159 @@ def validate_api_key(api_key: str) -> Tuple[bool, str]:
         return False, f"Unexpected error while validating key: {str(e)}"
 
 
-def analyze_sentiment(*, client: "OpenAI", model: str, text: str) -> tuple[SentimentResult, str]:
-    system = "You are a careful sentiment analysis assistant. Classify sentiment for the user's text into exactly one of: Positive, Negative, Neutral, Mixed. Return strict JSON only (no markdown)."
-    schema = {
-        "sentiment": "Positive|Negative|Neutral|Mixed",
-        "confidence": "number between 0 and 1",
-        "explanation": "short explanation (1-3 sentences)",
-        "key_phrases": "array of 3-8 short phrases from the input that justify the sentiment",
-    }
-    user = f"Analyze the sentiment of the following text and return JSON with keys exactly as in this schema: {json.dumps(schema)}\n\nText: {text}"
-    
-    # Configure parameters based on model type
-    # GPT-5 and reasoning models require temperature=1 (or default)
-    is_reasoning_model = model.lower().startswith('gpt-5') or 'reasoning' in model.lower()
-    
-    if is_reasoning_model:
-        # GPT-5 models only support temperature=1 (default)
-        resp = client.chat.completions.create(
-            model=model, 
-            messages=[{"role": "system", "content": system}, {"role": "user", "content": user}],
-            temperature=1
-        )
+@functools.lru_cache(maxsize=32)
+def _is_reasoning(model: str) -> bool:
+    name = model.lower()
+    return name.startswith("gpt-5") or "reasoning" in name
+
+
+def _normalize_text(text: str) -> str:
+    # Collapse runs of whitespace/newlines from pasted content; saves tokens without changing meaning
+    return " ".join(text.split())
+
+
+def _scan_partial(content: str, found: dict) -> bool:
+    updated = False
+    for field, pattern in _PARTIAL_PATTERNS.items():
+        if field in found:
+            continue
+        m = pattern.search(content)
+        if m:
+            found[field] = orjson.loads(m.group(1))
+            updated = True
+    return updated
+
+
+async def analyze_sentiment(*, client: "AsyncOpenAI", model: str, text: str, on_partial: Optional[Callable[[dict], None]] = None) -> tuple[SentimentResult, str]:
+    """Classify text, which must already be passed through _normalize_text (analyze_sentiment_cached does this)."""
+    messages = [{"role": "system", "content": SYSTEM_PROMPT}, {"role": "user", "content": _USER_PREFIX + text}]
+    kwargs: dict = {"model": model, "messages": messages, "stream": True}
+    if _is_reasoning(model):
+        # GPT-5 and reasoning models only support the default temperature (1) and plain JSON mode
+        kwargs["response_format"] = JSON_RESPONSE_FORMAT
     else:
         # Standard models support temperature=0 for deterministic output
-        resp = client.chat.completions.create(
-            model=model, 
-            messages=[{"role": "system", "content": system}, {"role": "user", "content": user}],
-            temperature=0
-        )
+        kwargs["temperature"] = 0
+        kwargs["response_format"] = STRUCTURED_RESPONSE_FORMAT
+    resp = await client.chat.completions.create(**kwargs)
     
-    # Extract reasoning for reasoning models (GPT-5, etc.)
-    reasoning = ""
-    if hasattr(resp.choices[0].message, 'reasoning_content') and resp.choices[0].message.reasoning_content:
-        reasoning = resp.choices[0].message.reasoning_content
+    # Accumulate the stream, surfacing fields to the UI as soon as each one is complete
+    buf, reasoning_buf = io.StringIO(), io.StringIO()
+    partial: dict = {}
+    async for chunk in resp:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+        # Reasoning models (GPT-5, etc.) may stream their thinking separately
+        if getattr(delta, "reasoning_content", None):
+            reasoning_buf.write(delta.reasoning_content)
+        if delta.content:
+            buf.write(delta.content)
+            if on_partial is not None and _scan_partial(buf.getvalue(), partial):
+                on_partial(dict(partial))
+    reasoning = reasoning_buf.getvalue()
     
-    content = (resp.choices[0].message.content or "").strip()
-    
-    try:
-        data = json.loads(content)
-    except json.JSONDecodeError:
-        start, end = content.find("{"), content.rfind("}")
-        if start == -1 or end == -1 or end <= start:
-            raise ValueError("Model did not return JSON.")
-        data = json.loads(content[start : end + 1])
+    data = orjson.loads(buf.getvalue() or "{}")
     
     sentiment = str(data.get("sentiment", "")).strip()
-    if sentiment not in SENTIMENT_LABELS:
+    if sentiment not in _SENTIMENT_SET:
         raise ValueError(f"Unexpected sentiment label: {sentiment}")
     
     confidence = max(0.0, min(1.0, float(data.get("confidence", 0.0))))
     explanation = str(data.get("explanation", "")).strip()
-    key_phrases = data.get("key_phrases", [])
-    if not isinstance(key_phrases, list):
-        key_phrases = []
-    key_phrases = [str(x).strip() for x in key_phrases if str(x).strip()][:12]
+    # Strict schema bounds the list server-side, but json_object mode (reasoning models) does not
+    raw_phrases = data.get("key_phrases")
+    key_phrases: list[str] = []
+    for x in raw_phrases if isinstance(raw_phrases, list) else ():
+        phrase = x.strip() if isinstance(x, str) else str(x).strip()
+        if phrase:
+            key_phrases.append(phrase)
+            if len(key_phrases) == 8:
+                break
     
     return SentimentResult(sentiment=sentiment, confidence=confidence, explanation=explanation, key_phrases=key_phrases), reasoning
 
 
-def main() -> None:
-    st.set_page_config(page_title=APP_TITLE, page_icon="🧠", layout="wide", initial_sidebar_state="expanded")
+def _cache_key(model: str, text: str) -> str:
+    return hashlib.sha256(f"{model}\x00{text}".encode()).hexdigest()
+
+
+async def _embed(client: "AsyncOpenAI", text: str) -> np.ndarray:
+    resp = await client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+    vec = np.asarray(resp.data[0].embedding, dtype=np.float32)
+    return vec / (np.linalg.norm(vec) or 1.0)
 
-    st.markdown("""
+
+async def _analyze_or_reuse(*, client: "AsyncOpenAI", model: str, text: str, vectors: Optional[np.ndarray], entries: list, on_partial: Optional[Callable[[dict], None]]) -> tuple[Optional[np.ndarray], tuple[dict, str], bool]:
+    OpenAIError = _openai_errors()[4]
+    analysis = None
+    if not entries:
+        # Nothing to match against, so no hit is possible: overlap the completion with the embedding request
+        analysis = asyncio.ensure_future(analyze_sentiment(client=client, model=model, text=text, on_partial=on_partial))
+    try:
+        vec = await _embed(client, text)
+    except OpenAIError:
+        # The semantic tier is only an optimization; fall back to the plain analysis
+        vec = None
+    except BaseException:
+        if analysis is not None:
+            analysis.cancel()
+        raise
+    if analysis is None:
+        # Check for a hit before sending the chat request, so hits cost no completion tokens
+        if vec is not None:
+            sims = vectors @ vec
+            best = int(np.argmax(sims))
+            if sims[best] > SEMANTIC_CACHE_THRESHOLD:
+                return vec, entries[best], True
+        analysis = analyze_sentiment(client=client, model=model, text=text, on_partial=on_partial)
+    result, reasoning = await analysis
+    return vec, (asdict(result), reasoning), False
+
+
+def analyze_sentiment_cached(*, client: "AsyncOpenAI", model: str, text: str, on_partial: Optional[Callable[[dict], None]] = None) -> tuple[SentimentResult, str]:
+    # Single normalization point: the same text feeds the cache key, the embedding and the prompt
+    text = _normalize_text(text)
+    # Exact tier: identical (model, text) pairs never hit the network again this session
+    exact = st.session_state.setdefault("_sent_cache", {})
+    key = _cache_key(model, text)
+    if key in exact:
+        # Re-insert so the dict's insertion order doubles as recency for eviction
+        exact[key] = exact.pop(key)
+        data, reasoning = exact[key]
+        return SentimentResult(**data), reasoning
+
+    # Semantic tier: near-duplicate text reuses a stored result when cosine similarity is high enough.
+    # Session state is only touched here in the script thread; the coroutine gets plain values.
+    semantic = st.session_state.setdefault("_sent_semantic", {})
+    store = semantic.get(model)
+    entries = store["entries"] if store else []
+    vectors = store["vectors"][: len(entries)] if store else None
+    updates = queue.SimpleQueue() if on_partial is not None else None
+    vec, entry, reused = _run_async(
+        _analyze_or_reuse(client=client, model=model, text=text, vectors=vectors, entries=entries, on_partial=updates.put if updates is not None else None),
+        updates,
+        on_partial,
+    )
+    exact[key] = entry
+    if len(exact) > SEMANTIC_CACHE_SIZE:
+        del exact[next(iter(exact))]
+    if vec is not None and not reused:
+        # Fixed-size ring buffer per model: inserts write one row in place and the oldest entry is evicted
+        if store is None:
+            store = semantic[model] = {"vectors": np.empty((SEMANTIC_CACHE_SIZE, vec.shape[0]), dtype=np.float32), "entries": [], "next": 0}
+        slot = store["next"]
+        store["vectors"][slot] = vec
+        if slot < len(store["entries"]):
+            store["entries"][slot] = entry
+        else:
+            store["entries"].append(entry)
+        store["next"] = (slot + 1) % SEMANTIC_CACHE_SIZE
+    data, reasoning = entry
+    return SentimentResult(**data), reasoning
+
+
+_APP_CSS = """
         <style>
         @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
         * {font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;}
@@ -174,9 +394,9 @@ def main() -> None:
         .footer {text-align: center; padding: 2rem 0 1rem 0; color: #6b7280; font-size: 0.9rem; border-top: 1px solid #e5e7eb; margin-top: 3rem;}
         .footer-badge {display: inline-block; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 0.3rem 0.8rem; border-radius: 999px; font-size: 0.85rem; font-weight: 600; margin: 0 0.3rem;}
         </style>
-    """, unsafe_allow_html=True)
+    """
 
-    st.markdown(f"""
+_HERO_HTML = f"""
         <div class="hero-container">
             <div class="hero-title">🧠 {APP_TITLE}</div>
             <div class="hero-subtitle">Advanced LLM-powered sentiment classification system providing instant, accurate analysis of text sentiment with detailed explanations and confidence metrics.</div>
@@ -198,7 +418,36 @@ def main() -> None:
                 <div class="stat-card"><div class="stat-icon">✨</div><div class="stat-label">Key Features</div><div class="stat-value">JSON Output · Key Phrases</div></div>
             </div>
         </div>
-    """, unsafe_allow_html=True)
+    """
+
+_FOOTER_HTML = """
+        <div class="footer">
+            <div style="margin-bottom: 1rem;">
+                <span class="footer-badge">Created by Ishan Chakraborty</span>
+                <span class="footer-badge">MIT License</span>
+            </div>
+            <div style="color: #9ca3af; font-size: 0.85rem;">
+                🔒 Privacy: Your API key and text are used only for analysis during this session. No data is stored or shared.<br/>
+                ⚠️ Do not paste sensitive or confidential information.
+            </div>
+        </div>
+    """
+
+_SIDEBAR_BRAND_HTML = f"""
+            <div style="text-align: center; padding: 1rem 0 1.5rem 0; border-bottom: 2px solid #e5e7eb; margin-bottom: 1.5rem;">
+                <div style="font-size: 3rem; margin-bottom: 0.5rem;">🧠</div>
+                <div style="font-size: 1.2rem; font-weight: 700; color: #1f2937; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; background-clip: text;">{APP_TITLE}</div>
+                <div style="font-size: 0.8rem; color: #6b7280; margin-top: 0.3rem;">AI-Powered Analysis</div>
+            </div>
+        """
+
+
+def main() -> None:
+    st.set_page_config(page_title=APP_TITLE, page_icon="🧠", layout="wide", initial_sidebar_state="expanded")
+
+    st.markdown(_APP_CSS, unsafe_allow_html=True)
+
+    st.markdown(_HERO_HTML, unsafe_allow_html=True)
 
     if "api_key" not in st.session_state:
         st.session_state.api_key = ""
@@ -210,18 +459,14 @@ def main() -> None:
         st.session_state.input_text = ""
 
     with st.sidebar:
-        st.markdown("""
-            <div style="text-align: center; padding: 1rem 0 1.5rem 0; border-bottom: 2px solid #e5e7eb; margin-bottom: 1.5rem;">
-                <div style="font-size: 3rem; margin-bottom: 0.5rem;">🧠</div>
-                <div style="font-size: 1.2rem; font-weight: 700; color: #1f2937; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; background-clip: text;">{}</div>
-                <div style="font-size: 0.8rem; color: #6b7280; margin-top: 0.3rem;">AI-Powered Analysis</div>
-            </div>
-        """.format(APP_TITLE), unsafe_allow_html=True)
+        st.markdown(_SIDEBAR_BRAND_HTML, unsafe_allow_html=True)
         
         st.header("⚙️ Setup")
         st.write("**Step 1:** Enter and validate your OpenAI API key.")
         api_key = st.text_input("OpenAI API Key", type="password", value=st.session_state.api_key, placeholder="sk-...", help="Your key is used only to call OpenAI from this app session.")
 
+        probe_key = st.checkbox("Verify with a live request", value=False, help="Sends a 1-token test request to OpenAI. Otherwise the key is checked on your first analysis.")
+
         col_a, col_b = st.columns([1, 1])
         with col_a:
             validate_clicked = st.button("Validate Key", use_container_width=True)
@@ -229,6 +474,9 @@ def main() -> None:
             clear_clicked = st.button("Clear", use_container_width=True)
 
         if clear_clicked:
+            # Cache entries are process-wide; drop only this session's key
+            _probe_api_key.clear(st.session_state.api_key)
+            _get_client.clear(st.session_state.api_key)
             st.session_state.api_key = ""
             st.session_state.key_valid = False
             st.session_state.key_status = ""
@@ -244,7 +492,7 @@ def main() -> None:
                 st.session_state.key_valid = False
                 st.session_state.key_status = "Please enter an API key."
             else:
-                ok, msg = validate_api_key(api_key)
+                ok, msg = validate_api_key(api_key, probe=probe_key)
                 st.session_state.key_valid = ok
                 st.session_state.key_status = msg
 
@@ -254,9 +502,7 @@ def main() -> None:
         st.divider()
         st.header("🤖 Model")
 
-        option_labels = [f"{mid} — {note}" for mid, note in RECOMMENDED_MODELS]
-        default_idx = next((idx for idx, (mid, _) in enumerate(RECOMMENDED_MODELS) if mid == DEFAULT_MODEL), 0)
-        selected_label = st.selectbox("Recommended models", options=option_labels, index=default_idx, help="Pick a recommended model for sentiment analysis.")
+        selected_label = st.selectbox("Recommended models", options=MODEL_OPTION_LABELS, index=DEFAULT_MODEL_INDEX, help="Pick a recommended model for sentiment analysis.")
         model = selected_label.split(" — ", 1)[0]
 
         st.divider()
@@ -265,11 +511,10 @@ def main() -> None:
     st.markdown('<div class="section-header"><span class="section-icon">✍️</span><h2 class="section-title">Input Text for Analysis</h2></div>', unsafe_allow_html=True)
     st.markdown("Choose from curated examples or paste your own text for sentiment classification.")
 
-    sentiment_icons = {"Positive": "😊", "Negative": "😞", "Neutral": "😐", "Mixed": "😕"}
     example_cols = st.columns(4)
     for idx, label in enumerate(SENTIMENT_LABELS):
         with example_cols[idx]:
-            if st.button(f"{sentiment_icons[label]} {label} Example", use_container_width=True, key=f"ex_{label}"):
+            if st.button(f"{_SENTIMENT_ICONS[label]} {label} Example", use_container_width=True, key=f"ex_{label}"):
                 st.session_state.input_text = EXAMPLES[label]
 
     st.text_area("📝 Text to analyze", key="input_text", height=180, placeholder="Type or paste any text here (reviews, emails, feedback, social media posts, etc.)...", help="Enter text between 10-2000 characters for best results")
@@ -277,7 +522,7 @@ def main() -> None:
     with st.expander("📚 View Example Sentiments", expanded=False):
         st.markdown("##### Professional examples for each sentiment category")
         for label in SENTIMENT_LABELS:
-            st.markdown(f"**{sentiment_icons[label]} {label}**")
+            st.markdown(f"**{_SENTIMENT_ICONS[label]} {label}**")
             st.info(EXAMPLES[label])
 
     st.markdown('<div class="section-header"><span class="section-icon">🤖</span><h2 class="section-title">Run Analysis</h2></div>', unsafe_allow_html=True)
@@ -297,14 +542,36 @@ def main() -> None:
         elif len(text) < 10:
             st.error("❌ Text is too short. Please enter at least 10 characters.")
         else:
-            # Check if reasoning model
-            is_reasoning_model = model.lower().startswith('gpt-5') or 'reasoning' in model.lower()
-            spinner_msg = f"🧠 {model} is thinking and reasoning..." if is_reasoning_model else "🤖 Analyzing sentiment with AI..."
+            spinner_msg = f"🧠 {model} is thinking and reasoning..." if _is_reasoning(model) else "🤖 Analyzing sentiment with AI..."
             
+            APIConnectionError, APIError, AuthenticationError, RateLimitError, _ = _openai_errors()
+            live = st.empty()
+
+            def render_partial(partial: dict) -> None:
+                # Show the label the moment it streams in; confidence/explanation/key phrases fill in as they land
+                sentiment = partial.get("sentiment")
+                if sentiment not in _SENTIMENT_SET:
+                    return
+                color = _SENTIMENT_COLORS[sentiment]
+                confidence = f"{int(max(0.0, min(1.0, float(partial['confidence']))) * 100)}%" if "confidence" in partial else "…"
+                explanation = html.escape(str(partial.get("explanation", "…")))
+                phrases = partial.get("key_phrases")
+                phrases_html = "".join(_PILL_TMPL.substitute(c=color, p=html.escape(str(phrase))) for phrase in phrases) if isinstance(phrases, list) else ""
+                live.markdown(f"""
+                    <div class="info-card" style="border-left: 4px solid {color};">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div style="font-size: 2rem; font-weight: 700; color: {color};">{_SENTIMENT_ICONS[sentiment]} {sentiment}</div>
+                            <div style="font-size: 2rem; font-weight: 700; color: {color};">{confidence}</div>
+                        </div>
+                        <div style="font-size: 0.9rem; color: #374151; margin-top: 0.5rem;">{explanation}</div>
+                        <div style="margin-top: 0.5rem;">{phrases_html}</div>
+                    </div>
+                """, unsafe_allow_html=True)
+
             with st.spinner(spinner_msg):
                 try:
                     client = _get_client(st.session_state.api_key)
-                    result, reasoning = analyze_sentiment(client=client, model=model, text=text)
+                    result, reasoning = analyze_sentiment_cached(client=client, model=model, text=text, on_partial=render_partial)
                     
                     # Display reasoning steps if available (for reasoning models)
                     if reasoning:
@@ -315,30 +582,14 @@ def main() -> None:
 
                     st.markdown('<div class="section-header"><span class="section-icon">📊</span><h2 class="section-title">Analysis Results</h2></div>', unsafe_allow_html=True)
                     
-                    sentiment_colors = {"Positive": "#10b981", "Negative": "#ef4444", "Neutral": "#6b7280", "Mixed": "#f59e0b"}
-                    color = sentiment_colors.get(result.sentiment, "#6b7280")
-                    emoji = sentiment_icons[result.sentiment]
+                    color = _SENTIMENT_COLORS.get(result.sentiment, "#6b7280")
+                    emoji = _SENTIMENT_ICONS[result.sentiment]
                     confidence_pct = int(result.confidence * 100)
                     
-                    st.markdown(f"""
-                        <div class="info-card" style="border-left: 4px solid {color};">
-                            <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 1rem;">
-                                <div>
-                                    <div style="font-size: 0.85rem; color: #6b7280; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 0.3rem;">Detected Sentiment</div>
-                                    <div style="font-size: 2rem; font-weight: 700; color: {color}; display: flex; align-items: center; gap: 0.5rem;"><span>{emoji}</span><span>{result.sentiment}</span></div>
-                                </div>
-                                <div style="text-align: right;">
-                                    <div style="font-size: 0.85rem; color: #6b7280; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 0.3rem;">Confidence</div>
-                                    <div style="font-size: 2rem; font-weight: 700; color: {color};">{confidence_pct}%</div>
-                                </div>
-                            </div>
-                            <div style="background: #f9fafb; padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
-                                <div style="font-size: 0.9rem; color: #374151; line-height: 1.6;"><strong style="color: #1f2937;">💡 Explanation:</strong> {result.explanation}</div>
-                            </div>
-                    """, unsafe_allow_html=True)
+                    st.markdown(_RESULT_CARD.substitute(color=color, emoji=emoji, sentiment=result.sentiment, confidence_pct=confidence_pct, explanation=html.escape(result.explanation)), unsafe_allow_html=True)
                     
                     if result.key_phrases:
-                        phrases_html = "".join([f'<span style="display: inline-block; background: {color}20; color: {color}; padding: 0.35rem 0.75rem; border-radius: 999px; margin: 0.25rem; font-size: 0.9rem; font-weight: 500; border: 1px solid {color}40;">{phrase}</span>' for phrase in result.key_phrases])
+                        phrases_html = "".join(_PILL_TMPL.substitute(c=color, p=html.escape(phrase)) for phrase in result.key_phrases)
                         st.markdown(f'<div style="margin-top: 1rem;"><div style="font-size: 0.9rem; color: #374151; font-weight: 600; margin-bottom: 0.5rem;">🔑 Key Phrases:</div><div>{phrases_html}</div></div></div>', unsafe_allow_html=True)
                     else:
                         st.markdown("</div>", unsafe_allow_html=True)
@@ -347,6 +598,8 @@ def main() -> None:
                     st.info("💡 **Pro Tip:** For better accuracy, provide context about who wrote the text, what situation it describes, and any relevant background information.")
 
                 except AuthenticationError:
+                    _probe_api_key.clear(st.session_state.api_key)
+                    _get_client.clear(st.session_state.api_key)
                     st.session_state.key_valid = False
                     st.error("🔐 Authentication failed: Your API key was rejected. Please validate a new key in the sidebar.")
                 except RateLimitError:
@@ -357,19 +610,10 @@ def main() -> None:
                     st.error(f"❌ OpenAI API error: {getattr(e, 'message', str(e))}")
                 except Exception as e:
                     st.error(f"❌ Unexpected error: {str(e)}")
+                finally:
+                    live.empty()
 
-    st.markdown("""
-        <div class="footer">
-            <div style="margin-bottom: 1rem;">
-                <span class="footer-badge">Created by Ishan Chakraborty</span>
-                <span class="footer-badge">MIT License</span>
-            </div>
-            <div style="color: #9ca3af; font-size: 0.85rem;">
-                🔒 Privacy: Your API key and text are used only for analysis during this session. No data is stored or shared.<br/>
-                ⚠️ Do not paste sensitive or confidential information.
-            </div>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":